@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
-from urllib.parse import urljoin
+from typing import Any, Iterator, Mapping
 
+import ijson
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
@@ -24,13 +24,18 @@ class SignalClient:
     def from_settings(cls, settings: Settings, logger: logging.Logger) -> "SignalClient":
         session = requests.Session()
         retry = Retry(
-            total=5,
-            backoff_factor=1,
+            total=3,
+            backoff_factor=1.0,
+            backoff_jitter=0.5,
+            backoff_max=30,
             status_forcelist=(429, 500, 502, 503, 504),
-            allowed_methods=("GET", "POST"),
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,
             raise_on_status=False,
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        adapter = HTTPAdapter(
+            max_retries=retry, pool_connections=8, pool_maxsize=16, pool_block=False
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
@@ -43,15 +48,26 @@ class SignalClient:
 
         return cls(settings=settings, session=session, logger=logger)
 
-    def fetch_json(self, endpoint: str, payload: dict[str, Any] | None) -> Any:
-        url = self._resolve_url(endpoint)
+    def fetch_json(
+        self,
+        url: str,
+        payload: Mapping[str, Any] | None,
+        items_path: str | None = None,
+    ) -> Any:
+        """Fetch the JSON body of an absolute endpoint URL.
+
+        When ``items_path`` is given (an ijson prefix such as ``"data.item"``),
+        the body is streamed and an iterator over the matching items is
+        returned instead of the fully decoded document.
+        """
         method = "POST" if payload is not None else "GET"
         self.logger.info("Fetching %s via %s", url, method)
         response = self.session.request(
             method=method,
             url=url,
-            json=payload,
+            json=dict(payload) if payload is not None else None,
             timeout=self.settings.timeout_seconds,
+            stream=items_path is not None,
         )
         if response.status_code >= 400:
             self.logger.error(
@@ -61,25 +77,30 @@ class SignalClient:
                 response.text,
             )
             response.raise_for_status()
+        if items_path is not None:
+            return _iter_items(response, url, items_path)
         try:
-            return response.json()
-        except json.JSONDecodeError as exc:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as exc:
             raise ValueError(f"Response from {url} was not valid JSON") from exc
 
-    def _resolve_url(self, endpoint: str) -> str:
-        if endpoint.startswith("http"):
-            return endpoint
-        if not self.settings.base_url:
-            raise ValueError("SIGNAL_BASE_URL is required for relative endpoints.")
-        return urljoin(self.settings.base_url.rstrip("/") + "/", endpoint.lstrip("/"))
+
+def _iter_items(response: requests.Response, url: str, items_path: str) -> Iterator[Any]:
+    response.raw.decode_content = True
+    try:
+        yield from ijson.items(response.raw, items_path, use_float=True)
+    except ijson.JSONError as exc:
+        raise ValueError(f"Response from {url} was not valid JSON") from exc
+    finally:
+        response.close()
 
 
-def _load_cookies(settings: Settings) -> dict[str, Any] | None:
+def _load_cookies(settings: Settings) -> Mapping[str, Any] | None:
     if settings.cookies_json:
         return settings.cookies_json
     if settings.cookies_path:
         path = Path(settings.cookies_path)
         if not path.exists():
             raise FileNotFoundError(f"Cookie file not found: {path}")
-        return json.loads(path.read_text())
+        return orjson.loads(path.read_bytes())
     return None
@@ -1,21 +1,28 @@
 from __future__ import annotations
 
-import json
 import os
 from dataclasses import dataclass
-from typing import Any, Iterable
+from functools import cache
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
+from urllib.parse import urljoin
 
+import orjson
 from dotenv import load_dotenv
 
 
-def _parse_json_env(name: str, default: dict[str, Any] | None = None) -> dict[str, Any] | None:
+def _parse_json_env(
+    name: str, default: Mapping[str, Any] | None = None
+) -> Mapping[str, Any] | None:
     value = os.getenv(name)
     if value is None or value == "":
         return default
     try:
-        return json.loads(value)
-    except json.JSONDecodeError as exc:
+        parsed = orjson.loads(value)
+    except orjson.JSONDecodeError as exc:
         raise ValueError(f"Environment variable {name} must be valid JSON.") from exc
+    # Read-only so the shared Settings instance can be used across threads.
+    return MappingProxyType(parsed) if isinstance(parsed, dict) else parsed
 
 
 def _parse_list_env(name: str, default: Iterable[str]) -> list[str]:
@@ -25,6 +32,14 @@ def _parse_list_env(name: str, default: Iterable[str]) -> list[str]:
     return [item.strip() for item in value.split(",") if item.strip()]
 
 
+def _resolve_url(base_url: str, endpoint: str) -> str:
+    if endpoint.startswith("http"):
+        return endpoint
+    if not base_url:
+        raise ValueError("SIGNAL_BASE_URL is required for relative endpoints.")
+    return urljoin(base_url.rstrip("/") + "/", endpoint.lstrip("/"))
+
+
 @dataclass(frozen=True)
 class Settings:
     base_url: str
@@ -32,21 +47,26 @@ class Settings:
     containers_at_terminal_url: str
     outgated_metrics_url: str
     berth_url: str
-    weekly_volumes_payload: dict[str, Any] | None
-    containers_at_terminal_payload: dict[str, Any] | None
-    outgated_metrics_payload: dict[str, Any] | None
-    berth_payload: dict[str, Any] | None
-    headers: dict[str, Any] | None
-    cookies_json: dict[str, Any] | None
+    weekly_volumes_payload: Mapping[str, Any] | None
+    containers_at_terminal_payload: Mapping[str, Any] | None
+    outgated_metrics_payload: Mapping[str, Any] | None
+    berth_payload: Mapping[str, Any] | None
+    weekly_volumes_items_path: str | None
+    containers_at_terminal_items_path: str | None
+    outgated_metrics_items_path: str | None
+    berth_items_path: str | None
+    headers: Mapping[str, Any] | None
+    cookies_json: Mapping[str, Any] | None
     cookies_path: str | None
     timeout_seconds: int
     log_level: str
     database_url: str
     db_schema: str
+    kpi_sql_pushdown: bool
     from_date: str | None
     to_date: str | None
-    congested_buckets: list[str]
-    slow_outgate_buckets: list[str]
+    congested_buckets: frozenset[str]
+    slow_outgate_buckets: frozenset[str]
     volume_pressure_high: float
     volume_pressure_low: float
     terminal_loaded_high: float
@@ -56,6 +76,7 @@ class Settings:
     berth_top_n: int
 
     @classmethod
+    @cache
     def from_env(cls) -> "Settings":
         load_dotenv()
         base_url = os.getenv("SIGNAL_BASE_URL", "").strip()
@@ -82,14 +103,20 @@ class Settings:
 
         return cls(
             base_url=base_url,
-            weekly_volumes_url=weekly_volumes_url,
-            containers_at_terminal_url=containers_at_terminal_url,
-            outgated_metrics_url=outgated_metrics_url,
-            berth_url=berth_url,
+            weekly_volumes_url=_resolve_url(base_url, weekly_volumes_url),
+            containers_at_terminal_url=_resolve_url(base_url, containers_at_terminal_url),
+            outgated_metrics_url=_resolve_url(base_url, outgated_metrics_url),
+            berth_url=_resolve_url(base_url, berth_url),
             weekly_volumes_payload=_parse_json_env("SIGNAL_WEEKLY_VOLUMES_PAYLOAD"),
             containers_at_terminal_payload=_parse_json_env("SIGNAL_CONTAINERS_AT_TERMINAL_PAYLOAD"),
             outgated_metrics_payload=_parse_json_env("SIGNAL_OUTGATED_METRICS_PAYLOAD"),
             berth_payload=_parse_json_env("SIGNAL_BERTH_PAYLOAD"),
+            weekly_volumes_items_path=os.getenv("SIGNAL_WEEKLY_VOLUMES_ITEMS_PATH") or None,
+            containers_at_terminal_items_path=(
+                os.getenv("SIGNAL_CONTAINERS_AT_TERMINAL_ITEMS_PATH") or None
+            ),
+            outgated_metrics_items_path=os.getenv("SIGNAL_OUTGATED_METRICS_ITEMS_PATH") or None,
+            berth_items_path=os.getenv("SIGNAL_BERTH_ITEMS_PATH") or None,
             headers=_parse_json_env("SIGNAL_HEADERS_JSON"),
             cookies_json=_parse_json_env("SIGNAL_COOKIES_JSON"),
             cookies_path=os.getenv("SIGNAL_COOKIES_PATH"),
@@ -97,13 +124,15 @@ class Settings:
             log_level=os.getenv("LOG_LEVEL", "INFO"),
             database_url=database_url,
             db_schema=os.getenv("DB_SCHEMA", "public"),
+            kpi_sql_pushdown=os.getenv("KPI_SQL_PUSHDOWN", "").strip().lower()
+            in {"1", "true", "yes"},
             from_date=os.getenv("FROM_DATE"),
             to_date=os.getenv("TO_DATE"),
-            congested_buckets=_parse_list_env(
-                "CONGESTED_BUCKETS", ["9-12 Days", "13+ Days"]
+            congested_buckets=frozenset(
+                _parse_list_env("CONGESTED_BUCKETS", ["9-12 Days", "13+ Days"])
             ),
-            slow_outgate_buckets=_parse_list_env(
-                "SLOW_OUTGATE_BUCKETS", ["5-8 Days", "9-12 Days", "13+ Days"]
+            slow_outgate_buckets=frozenset(
+                _parse_list_env("SLOW_OUTGATE_BUCKETS", ["5-8 Days", "9-12 Days", "13+ Days"])
             ),
             volume_pressure_high=float(os.getenv("VOLUME_PRESSURE_HIGH", "1.15")),
             volume_pressure_low=float(os.getenv("VOLUME_PRESSURE_LOW", "0.90")),
@@ -1,13 +1,28 @@
 from __future__ import annotations
 
-from typing import Mapping
+import csv
+from io import StringIO
+from typing import Any, Iterable, Mapping
 
 import pandas as pd
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+
+# Multi-row INSERTs serve the dialects without a bulk path: SQLite, MySQL and
+# Postgres drivers that cannot COPY (e.g. pg8000). 30000 bind parameters per
+# statement stays under SQLite's 32766 and MySQL/Postgres's 65535 limits.
+_MAX_BIND_PARAMS = 30000
+# Postgres drivers whose cursors expose COPY FROM STDIN to _psql_copy.
+_COPY_DRIVERS = {"psycopg2", "psycopg"}
 
 
 def create_db_engine(database_url: str):
-    return create_engine(database_url)
+    url = make_url(database_url)
+    if url.get_backend_name() == "mssql" and url.get_driver_name() == "pyodbc":
+        # Sends executemany() parameter sets to SQL Server as one batch
+        # instead of one round-trip per row.
+        return create_engine(url, fast_executemany=True)
+    return create_engine(url)
 
 
 def write_tables(
@@ -15,5 +30,49 @@ def write_tables(
     schema: str,
     tables: Mapping[str, pd.DataFrame],
 ) -> None:
-    for table_name, df in tables.items():
-        df.to_sql(table_name, engine, schema=schema, if_exists="replace", index=False)
+    # One connection and transaction: readers see either all KPI tables
+    # replaced or none of them.
+    with engine.begin() as conn:
+        for table_name, df in tables.items():
+            df.to_sql(
+                table_name,
+                conn,
+                schema=schema,
+                if_exists="replace",
+                index=False,
+                **_insert_options(engine, df),
+            )
+
+
+def _insert_options(engine, df: pd.DataFrame) -> dict[str, Any]:
+    if engine.dialect.name == "postgresql" and engine.dialect.driver in _COPY_DRIVERS:
+        return {"method": _psql_copy}
+    if engine.dialect.name == "mssql":
+        # SQL Server allows only 2100 bind parameters per statement, so keep
+        # pandas' executemany() path and let fast_executemany batch it.
+        return {"method": None, "chunksize": 10000}
+    chunksize = max(1, _MAX_BIND_PARAMS // max(1, len(df.columns)))
+    return {"method": "multi", "chunksize": chunksize}
+
+
+def _psql_copy(table, conn, keys: list[str], data_iter: Iterable[tuple[Any, ...]]) -> None:
+    """Bulk-load rows with Postgres ``COPY FROM STDIN`` (pandas ``to_sql`` method)."""
+    quote = conn.dialect.identifier_preparer.quote
+    table_name = quote(table.name)
+    if table.schema:
+        table_name = f"{quote(table.schema)}.{table_name}"
+    columns = ", ".join(quote(key) for key in keys)
+
+    dbapi_conn = conn.connection
+    with dbapi_conn.cursor() as cursor:
+        if hasattr(cursor, "copy"):
+            # psycopg 3 adapts each value straight into the COPY stream.
+            with cursor.copy(f"COPY {table_name} ({columns}) FROM STDIN") as copy:
+                for row in data_iter:
+                    copy.write_row(row)
+            return
+
+        buffer = StringIO()
+        csv.writer(buffer).writerows(data_iter)
+        buffer.seek(0)
+        cursor.copy_expert(f"COPY {table_name} ({columns}) FROM STDIN WITH CSV", buffer)
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Integer, inspect, text
+
+from src.config import Settings
+
+STAGING_TABLES = {
+    "weekly": "stg_weekly_volumes",
+    "terminal": "stg_terminal_containers",
+    "outgate": "stg_outgate_metrics",
+    "berth": "stg_berth",
+}
+
+_WEEKLY_SQL = """
+CREATE TABLE {kpi_weekly_volume_pressure} AS
+WITH rolled AS (
+    SELECT
+        week_start_date,
+        inbound_full_containers,
+        avg(CAST(inbound_full_containers AS double precision)) OVER (
+            ORDER BY week_start_date ROWS BETWEEN 3 PRECEDING AND CURRENT ROW
+        ) AS rolling_4w_avg_teu
+    FROM {stg_weekly_volumes}
+),
+indexed AS (
+    SELECT
+        *,
+        inbound_full_containers / NULLIF(rolling_4w_avg_teu, 0) AS volume_pressure_index
+    FROM rolled
+)
+SELECT
+    week_start_date,
+    inbound_full_containers,
+    rolling_4w_avg_teu,
+    volume_pressure_index,
+    CASE
+        WHEN volume_pressure_index <= :low_threshold THEN 'LOW'
+        WHEN volume_pressure_index >= :high_threshold THEN 'HIGH'
+        ELSE 'NORMAL'
+    END AS flag,
+    {metadata}
+FROM indexed
+ORDER BY week_start_date
+"""
+
+_TERMINAL_SQL = """
+CREATE TABLE {kpi_terminal_congestion} AS
+WITH totals AS (
+    SELECT
+        load_type,
+        CAST(sum(containers) AS {terminal_count_type}) AS total_containers,
+        CAST(
+            coalesce(sum(containers) FILTER (WHERE bucket = ANY(:congested_buckets)), 0)
+            AS {terminal_count_type}
+        ) AS congested_containers
+    FROM {stg_terminal_containers}
+    GROUP BY load_type
+),
+pct AS (
+    SELECT
+        *,
+        CASE
+            WHEN total_containers <> 0
+                THEN CAST(congested_containers AS double precision) / total_containers
+            ELSE 0.0
+        END AS congested_pct
+    FROM totals
+)
+SELECT
+    load_type,
+    total_containers,
+    congested_containers,
+    congested_pct,
+    CASE
+        WHEN load_type = 'loaded' AND congested_pct >= :loaded_high THEN 'HIGH'
+        WHEN load_type = 'empty' AND congested_pct >= :empty_high THEN 'HIGH'
+        ELSE 'NORMAL'
+    END AS flag,
+    {metadata}
+FROM pct
+ORDER BY load_type
+"""
+
+_OUTGATE_SQL = """
+CREATE TABLE {kpi_outgate_stress_by_status} AS
+WITH totals AS (
+    SELECT
+        status,
+        CAST(sum(containers) AS {outgate_count_type}) AS total_containers,
+        CAST(
+            coalesce(sum(containers) FILTER (WHERE bucket = ANY(:slow_buckets)), 0)
+            AS {outgate_count_type}
+        ) AS slow_containers
+    FROM {stg_outgate_metrics}
+    GROUP BY status
+),
+pct AS (
+    SELECT
+        *,
+        CASE
+            WHEN total_containers <> 0
+                THEN CAST(slow_containers AS double precision) / total_containers
+            ELSE 0.0
+        END AS slow_pct
+    FROM totals
+)
+SELECT
+    status,
+    total_containers,
+    slow_containers,
+    slow_pct,
+    CASE WHEN slow_pct >= :slow_high THEN 'HIGH' ELSE 'NORMAL' END AS flag,
+    {metadata}
+FROM pct
+ORDER BY status
+"""
+
+_BERTH_SQL = """
+CREATE TABLE {kpi_berth_snapshot} AS
+WITH summary AS (
+    SELECT
+        avg(CAST(time_at_berth_hours AS double precision)) AS avg_time_at_berth_hours
+    FROM {stg_berth}
+),
+flagged AS (
+    SELECT
+        avg_time_at_berth_hours,
+        CASE
+            WHEN avg_time_at_berth_hours >= :berth_high_hours THEN 'HIGH'
+            ELSE 'NORMAL'
+        END AS flag
+    FROM summary
+),
+vessels AS (
+    SELECT vessel, terminal, time_at_berth_hours
+    FROM {stg_berth}
+    ORDER BY time_at_berth_hours DESC
+    LIMIT :top_n
+)
+SELECT
+    record_type,
+    vessel,
+    terminal,
+    time_at_berth_hours,
+    avg_time_at_berth_hours,
+    flag,
+    {metadata}
+FROM (
+    SELECT
+        0 AS sort_group,
+        'summary' AS record_type,
+        CAST(NULL AS text) AS vessel,
+        CAST(NULL AS text) AS terminal,
+        CAST(NULL AS double precision) AS time_at_berth_hours,
+        avg_time_at_berth_hours,
+        flag
+    FROM flagged
+    UNION ALL
+    SELECT
+        1,
+        'vessel',
+        vessels.vessel,
+        vessels.terminal,
+        CAST(vessels.time_at_berth_hours AS double precision),
+        flagged.avg_time_at_berth_hours,
+        flagged.flag
+    FROM vessels
+    CROSS JOIN flagged
+) AS snapshot
+ORDER BY sort_group, time_at_berth_hours DESC
+"""
+
+_HEALTH_SQL = """
+CREATE TABLE {kpi_health_summary} AS
+SELECT
+    (
+        SELECT flag FROM {kpi_weekly_volume_pressure}
+        ORDER BY week_start_date DESC
+        LIMIT 1
+    ) AS volume_pressure_flag,
+    coalesce(
+        (SELECT flag FROM {kpi_terminal_congestion} WHERE load_type = 'loaded' LIMIT 1),
+        'UNKNOWN'
+    ) AS terminal_congestion_loaded_flag,
+    coalesce(
+        (SELECT flag FROM {kpi_terminal_congestion} WHERE load_type = 'empty' LIMIT 1),
+        'UNKNOWN'
+    ) AS terminal_congestion_empty_flag,
+    coalesce(
+        (
+            SELECT string_agg(status, ', ' ORDER BY status)
+            FROM {kpi_outgate_stress_by_status}
+            WHERE flag = 'HIGH'
+        ),
+        'NONE'
+    ) AS outgate_stress_high_statuses,
+    (
+        SELECT flag FROM {kpi_berth_snapshot}
+        WHERE record_type = 'summary'
+        LIMIT 1
+    ) AS berth_flag,
+    CAST(:extraction_ts_utc AS timestamptz) AS extraction_ts_utc
+"""
+
+_KPI_STATEMENTS = {
+    "kpi_weekly_volume_pressure": _WEEKLY_SQL,
+    "kpi_terminal_congestion": _TERMINAL_SQL,
+    "kpi_outgate_stress_by_status": _OUTGATE_SQL,
+    "kpi_berth_snapshot": _BERTH_SQL,
+    "kpi_health_summary": _HEALTH_SQL,
+}
+
+
+def build_kpi_tables_in_db(
+    engine,
+    schema: str,
+    settings: Settings,
+    extraction_ts_utc: datetime,
+) -> None:
+    """Rebuild the KPI tables in Postgres from the ``STAGING_TABLES`` data."""
+    if engine.dialect.name != "postgresql":
+        raise ValueError("Server-side KPI builds require a PostgreSQL database.")
+
+    quote = engine.dialect.identifier_preparer.quote
+    tables = {
+        name: f"{quote(schema)}.{quote(name)}" if schema else quote(name)
+        for name in [*STAGING_TABLES.values(), *_KPI_STATEMENTS]
+    }
+    metadata = _metadata_columns(settings.from_date, settings.to_date)
+    params = {
+        "extraction_ts_utc": extraction_ts_utc,
+        "from_date": settings.from_date,
+        "to_date": settings.to_date,
+        "high_threshold": settings.volume_pressure_high,
+        "low_threshold": settings.volume_pressure_low,
+        "congested_buckets": sorted(settings.congested_buckets),
+        "loaded_high": settings.terminal_loaded_high,
+        "empty_high": settings.terminal_empty_high,
+        "slow_buckets": sorted(settings.slow_outgate_buckets),
+        "slow_high": settings.outgate_slow_high,
+        "berth_high_hours": settings.berth_high_hours,
+        "top_n": settings.berth_top_n,
+    }
+
+    with engine.begin() as conn:
+        count_types = {
+            "terminal_count_type": _sum_type(conn, schema, STAGING_TABLES["terminal"]),
+            "outgate_count_type": _sum_type(conn, schema, STAGING_TABLES["outgate"]),
+        }
+        for table_name, statement in _KPI_STATEMENTS.items():
+            conn.execute(text(f"DROP TABLE IF EXISTS {tables[table_name]}"))
+            conn.execute(
+                text(statement.format(metadata=metadata, **count_types, **tables)), params
+            )
+
+
+def _sum_type(conn, schema: str, table_name: str) -> str:
+    # Postgres widens sum(bigint) to numeric; keep integer counts as bigint
+    # like pandas does and leave float counts as double precision.
+    columns = inspect(conn).get_columns(table_name, schema=schema or None)
+    containers = next(column for column in columns if column["name"] == "containers")
+    return "bigint" if isinstance(containers["type"], Integer) else "double precision"
+
+
+def _metadata_columns(from_date: str | None, to_date: str | None) -> str:
+    columns = ["CAST(:extraction_ts_utc AS timestamptz) AS extraction_ts_utc"]
+    if from_date:
+        columns.append("CAST(:from_date AS text) AS from_date")
+    if to_date:
+        columns.append("CAST(:to_date AS text) AS to_date")
+    return ",\n    ".join(columns)
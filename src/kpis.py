@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Collection
 
+import numpy as np
 import pandas as pd
 
 
@@ -13,22 +15,26 @@ def build_weekly_volume_pressure(
     high_threshold: float,
     low_threshold: float,
 ) -> pd.DataFrame:
-    df = weekly_df.copy()
-    df["week_start_date"] = pd.to_datetime(df["week_start_date"])
-    df = df.sort_values("week_start_date")
+    # Dates arrive as ISO "YYYY-MM-DD" strings, so they sort chronologically
+    # as-is and sort_values() already hands back a new frame to extend.
+    df = weekly_df.sort_values("week_start_date")
     df["rolling_4w_avg_teu"] = (
         df["inbound_full_containers"].rolling(window=4, min_periods=1).mean()
     )
     df["volume_pressure_index"] = df["inbound_full_containers"] / df["rolling_4w_avg_teu"]
-    df["flag"] = "NORMAL"
-    df.loc[df["volume_pressure_index"] >= high_threshold, "flag"] = "HIGH"
-    df.loc[df["volume_pressure_index"] <= low_threshold, "flag"] = "LOW"
+    df["flag"] = np.select(
+        [
+            df["volume_pressure_index"] <= low_threshold,
+            df["volume_pressure_index"] >= high_threshold,
+        ],
+        ["LOW", "HIGH"],
+        default="NORMAL",
+    )
     df["extraction_ts_utc"] = extraction_ts_utc
     if from_date:
         df["from_date"] = from_date
     if to_date:
         df["to_date"] = to_date
-    df["week_start_date"] = df["week_start_date"].dt.date.astype(str)
     return df
 
 
@@ -37,32 +43,31 @@ def build_terminal_congestion(
     extraction_ts_utc: datetime,
     from_date: str | None,
     to_date: str | None,
-    congested_buckets: list[str],
+    congested_buckets: Collection[str],
     loaded_high: float,
     empty_high: float,
 ) -> pd.DataFrame:
-    df = terminal_df.copy()
-    grouped = df.groupby("load_type", dropna=False)
-    rows = []
-    for load_type, subset in grouped:
-        total = subset["containers"].sum()
-        congested = subset[subset["bucket"].isin(congested_buckets)]["containers"].sum()
-        congested_pct = congested / total if total else 0.0
-        flag = "NORMAL"
-        if load_type.lower() == "loaded" and congested_pct >= loaded_high:
-            flag = "HIGH"
-        if load_type.lower() == "empty" and congested_pct >= empty_high:
-            flag = "HIGH"
-        rows.append(
-            {
-                "load_type": load_type,
-                "total_containers": total,
-                "congested_containers": congested,
-                "congested_pct": congested_pct,
-                "flag": flag,
-            }
-        )
-    result = pd.DataFrame(rows)
+    totals = terminal_df.groupby("load_type", dropna=False)["containers"].sum()
+    congested = (
+        terminal_df["containers"]
+        .where(terminal_df["bucket"].isin(congested_buckets), 0)
+        .groupby(terminal_df["load_type"], dropna=False)
+        .sum()
+    )
+    congested_pct = (congested / totals).where(totals != 0, 0.0).to_numpy()
+    load_type = totals.index
+    is_high = ((load_type == "loaded") & (congested_pct >= loaded_high)) | (
+        (load_type == "empty") & (congested_pct >= empty_high)
+    )
+    result = pd.DataFrame(
+        {
+            "load_type": totals.index,
+            "total_containers": totals.to_numpy(),
+            "congested_containers": congested.to_numpy(),
+            "congested_pct": congested_pct,
+            "flag": np.where(is_high, "HIGH", "NORMAL"),
+        }
+    )
     if result.empty:
         raise ValueError("Terminal congestion KPI produced no rows.")
     result["extraction_ts_utc"] = extraction_ts_utc
@@ -78,27 +83,26 @@ def build_outgate_stress_by_status(
     extraction_ts_utc: datetime,
     from_date: str | None,
     to_date: str | None,
-    slow_buckets: list[str],
+    slow_buckets: Collection[str],
     slow_high: float,
 ) -> pd.DataFrame:
-    df = outgate_df.copy()
-    grouped = df.groupby("status", dropna=False)
-    rows = []
-    for status, subset in grouped:
-        total = subset["containers"].sum()
-        slow = subset[subset["bucket"].isin(slow_buckets)]["containers"].sum()
-        slow_pct = slow / total if total else 0.0
-        flag = "HIGH" if slow_pct >= slow_high else "NORMAL"
-        rows.append(
-            {
-                "status": status,
-                "total_containers": total,
-                "slow_containers": slow,
-                "slow_pct": slow_pct,
-                "flag": flag,
-            }
-        )
-    result = pd.DataFrame(rows)
+    totals = outgate_df.groupby("status", dropna=False)["containers"].sum()
+    slow = (
+        outgate_df["containers"]
+        .where(outgate_df["bucket"].isin(slow_buckets), 0)
+        .groupby(outgate_df["status"], dropna=False)
+        .sum()
+    )
+    slow_pct = (slow / totals).where(totals != 0, 0.0).to_numpy()
+    result = pd.DataFrame(
+        {
+            "status": totals.index,
+            "total_containers": totals.to_numpy(),
+            "slow_containers": slow.to_numpy(),
+            "slow_pct": slow_pct,
+            "flag": np.where(slow_pct >= slow_high, "HIGH", "NORMAL"),
+        }
+    )
     if result.empty:
         raise ValueError("Outgate stress KPI produced no rows.")
     result["extraction_ts_utc"] = extraction_ts_utc
@@ -117,33 +121,29 @@ def build_berth_snapshot(
     berth_high_hours: float,
     top_n: int,
 ) -> pd.DataFrame:
-    df = berth_df.copy()
-    avg_time = df["time_at_berth_hours"].mean()
+    avg_time = berth_df["time_at_berth_hours"].mean()
     flag = "HIGH" if avg_time >= berth_high_hours else "NORMAL"
-    summary = pd.DataFrame(
-        [
-            {
-                "record_type": "summary",
-                "vessel": None,
-                "terminal": None,
-                "time_at_berth_hours": None,
-                "avg_time_at_berth_hours": avg_time,
-                "flag": flag,
-            }
-        ]
-    )
-
-    vessels = (
-        df.sort_values("time_at_berth_hours", ascending=False)
-        .head(top_n)
-        .assign(
-            record_type="vessel",
-            avg_time_at_berth_hours=avg_time,
-            flag=flag,
-        )
-    )
-
-    result = pd.concat([summary, vessels], ignore_index=True)
+    summary = {
+        "record_type": "summary",
+        "vessel": None,
+        "terminal": None,
+        "time_at_berth_hours": None,
+        "avg_time_at_berth_hours": avg_time,
+        "flag": flag,
+    }
+    vessels = [
+        {
+            "record_type": "vessel",
+            "vessel": vessel["vessel"],
+            "terminal": vessel["terminal"],
+            "time_at_berth_hours": vessel["time_at_berth_hours"],
+            "avg_time_at_berth_hours": avg_time,
+            "flag": flag,
+        }
+        for vessel in berth_df.nlargest(top_n, "time_at_berth_hours").to_dict("records")
+    ]
+
+    result = pd.DataFrame([summary, *vessels])
     result["extraction_ts_utc"] = extraction_ts_utc
     if from_date:
         result["from_date"] = from_date
@@ -177,7 +177,7 @@ def build_health_summary(
 
 
 def _flag_for_load_type(df: pd.DataFrame, load_type: str) -> str:
-    subset = df[df["load_type"].str.lower() == load_type]
+    subset = df[df["load_type"] == load_type]
     if subset.empty:
         return "UNKNOWN"
     return subset.iloc[0]["flag"]
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from typing import Any, Callable, Mapping
+
+import pandas as pd
 
 from src.client import SignalClient
 from src.config import Settings
 from src.db import create_db_engine, write_tables
+from src.kpi_sql import STAGING_TABLES, build_kpi_tables_in_db
 from src.kpis import (
     build_berth_snapshot,
     build_health_summary,
@@ -29,6 +34,16 @@ def configure_logging(level: str) -> logging.Logger:
     return logging.getLogger("signal_pipeline")
 
 
+def _fetch_and_parse(
+    client: SignalClient,
+    parser: Callable[[Any], pd.DataFrame],
+    url: str,
+    payload: Mapping[str, Any] | None,
+    items_path: str | None,
+) -> pd.DataFrame:
+    return parser(client.fetch_json(url, payload, items_path))
+
+
 def run_pipeline() -> None:
     settings = Settings.from_env()
     logger = configure_logging(settings.log_level)
@@ -37,22 +52,74 @@ def run_pipeline() -> None:
     client = SignalClient.from_settings(settings, logger)
     extraction_ts_utc = datetime.now(timezone.utc)
 
-    weekly_payload = client.fetch_json(
-        settings.weekly_volumes_url, settings.weekly_volumes_payload
-    )
-    terminal_payload = client.fetch_json(
-        settings.containers_at_terminal_url, settings.containers_at_terminal_payload
-    )
-    outgate_payload = client.fetch_json(
-        settings.outgated_metrics_url, settings.outgated_metrics_payload
-    )
-    berth_payload = client.fetch_json(settings.berth_url, settings.berth_payload)
+    endpoints = {
+        "weekly": (
+            parse_weekly_volumes,
+            settings.weekly_volumes_url,
+            settings.weekly_volumes_payload,
+            settings.weekly_volumes_items_path,
+        ),
+        "terminal": (
+            parse_terminal_containers,
+            settings.containers_at_terminal_url,
+            settings.containers_at_terminal_payload,
+            settings.containers_at_terminal_items_path,
+        ),
+        "outgate": (
+            parse_outgate_metrics,
+            settings.outgated_metrics_url,
+            settings.outgated_metrics_payload,
+            settings.outgated_metrics_items_path,
+        ),
+        "berth": (
+            parse_berth_data,
+            settings.berth_url,
+            settings.berth_payload,
+            settings.berth_items_path,
+        ),
+    }
+    # Parse inside the worker so streamed bodies are read concurrently.
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        futures = {
+            name: executor.submit(_fetch_and_parse, client, *endpoint)
+            for name, endpoint in endpoints.items()
+        }
+        weekly_df = futures["weekly"].result()
+        terminal_df = futures["terminal"].result()
+        outgate_df = futures["outgate"].result()
+        berth_df = futures["berth"].result()
+
+    engine = create_db_engine(settings.database_url)
+    if settings.kpi_sql_pushdown and engine.dialect.name == "postgresql":
+        staging = {
+            STAGING_TABLES["weekly"]: weekly_df,
+            STAGING_TABLES["terminal"]: terminal_df,
+            STAGING_TABLES["outgate"]: outgate_df,
+            STAGING_TABLES["berth"]: berth_df,
+        }
+        write_tables(engine, settings.db_schema, staging)
+        build_kpi_tables_in_db(engine, settings.db_schema, settings, extraction_ts_utc)
+    else:
+        if settings.kpi_sql_pushdown:
+            logger.warning(
+                "KPI_SQL_PUSHDOWN requires PostgreSQL; building KPIs in pandas for %s",
+                engine.dialect.name,
+            )
+        tables = build_kpi_tables(
+            settings, weekly_df, terminal_df, outgate_df, berth_df, extraction_ts_utc
+        )
+        write_tables(engine, settings.db_schema, tables)
+    logger.info("KPI tables written to schema %s", settings.db_schema)
 
-    weekly_df = parse_weekly_volumes(weekly_payload)
-    terminal_df = parse_terminal_containers(terminal_payload)
-    outgate_df = parse_outgate_metrics(outgate_payload)
-    berth_df = parse_berth_data(berth_payload)
 
+def build_kpi_tables(
+    settings: Settings,
+    weekly_df: pd.DataFrame,
+    terminal_df: pd.DataFrame,
+    outgate_df: pd.DataFrame,
+    berth_df: pd.DataFrame,
+    extraction_ts_utc: datetime,
+) -> dict[str, pd.DataFrame]:
     kpi_weekly = build_weekly_volume_pressure(
         weekly_df,
         extraction_ts_utc,
@@ -89,17 +156,13 @@ def run_pipeline() -> None:
     kpi_health = build_health_summary(
         kpi_weekly, kpi_terminal, kpi_outgate, kpi_berth, extraction_ts_utc
     )
-
-    engine = create_db_engine(settings.database_url)
-    tables = {
+    return {
         "kpi_weekly_volume_pressure": kpi_weekly,
         "kpi_terminal_congestion": kpi_terminal,
         "kpi_outgate_stress_by_status": kpi_outgate,
         "kpi_berth_snapshot": kpi_berth,
         "kpi_health_summary": kpi_health,
     }
-    write_tables(engine, settings.db_schema, tables)
-    logger.info("KPI tables written to schema %s", settings.db_schema)
 
 
 if __name__ == "__main__":
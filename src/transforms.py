@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
 import pandas as pd
 
@@ -10,8 +9,8 @@ class DataShapeError(ValueError):
     pass
 
 
-def _extract_list(payload: Any, keys: Iterable[str]) -> list[dict[str, Any]]:
-    if isinstance(payload, list):
+def _extract_list(payload: Any, keys: Iterable[str]) -> Iterable[dict[str, Any]]:
+    if isinstance(payload, (list, Iterator)):
         return payload
     if isinstance(payload, dict):
         for key in keys:
@@ -20,128 +19,162 @@ def _extract_list(payload: Any, keys: Iterable[str]) -> list[dict[str, Any]]:
     raise DataShapeError(f"Expected list payload with keys {list(keys)}")
 
 
-def _get_required_key(item: dict[str, Any], keys: Iterable[str]) -> Any:
-    for key in keys:
-        if key in item and item[key] is not None:
-            return item[key]
-    raise DataShapeError(f"Missing required keys {list(keys)} in item {item}")
-
-
-def _parse_date(value: Any) -> str:
-    if isinstance(value, datetime):
-        return value.date().isoformat()
-    if isinstance(value, (int, float)):
-        return datetime.utcfromtimestamp(value).date().isoformat()
-    if isinstance(value, str):
-        return pd.to_datetime(value).date().isoformat()
-    raise DataShapeError(f"Unable to parse date value: {value}")
+def _get_required_column(df: pd.DataFrame, keys: Iterable[str]) -> pd.Series:
+    keys = list(keys)
+    present = [key for key in keys if key in df.columns]
+    if not present:
+        raise DataShapeError(f"Missing required keys {keys} in payload items")
+    column = df[present[0]]
+    for key in present[1:]:
+        column = column.combine_first(df[key])
+    missing = column.isna()
+    if missing.any():
+        item = df.loc[missing.idxmax()].dropna().to_dict()
+        raise DataShapeError(f"Missing required keys {keys} in item {item}")
+    return column
+
+
+def _get_optional_column(df: pd.DataFrame, keys: Iterable[str]) -> pd.Series:
+    # Empty strings fall through to the next alias, as with ``a or b``.
+    present = [df[key].replace("", None) for key in keys if key in df.columns]
+    if not present:
+        return pd.Series(None, index=df.index, dtype=object)
+    column = present[0]
+    for other in present[1:]:
+        column = column.combine_first(other)
+    return column
+
+
+def _numeric_column(column: pd.Series, error: str) -> pd.Series:
+    # JSON numbers already arrive as int64/float64 columns; only mixed or
+    # string-typed columns need converting.
+    if pd.api.types.is_numeric_dtype(column):
+        return column
+    try:
+        # Object input keeps numpy int64/float64 rather than nullable dtypes.
+        converted = pd.to_numeric(column.astype(object), errors="raise")
+    except (TypeError, ValueError) as exc:
+        raise DataShapeError(error) from exc
+    if converted.isna().any():
+        raise DataShapeError(error)
+    return converted
+
+
+def _parse_date_column(column: pd.Series) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(column):
+        parsed = pd.to_datetime(column, unit="s", errors="coerce", utc=True)
+        dates = parsed.dt.strftime("%Y-%m-%d")
+    else:
+        # Keep the wall-clock date of ISO timestamps regardless of their offset.
+        prefix = column.str[:10]
+        dates = pd.to_datetime(prefix, format="%Y-%m-%d", errors="coerce").dt.strftime(
+            "%Y-%m-%d"
+        )
+        # Epoch seconds can share an object column with date strings; only
+        # non-string values are read as epochs so "20240101" stays a date.
+        epochs = prefix.isna() & column.notna()
+        if epochs.any():
+            dates[epochs] = pd.to_datetime(
+                pd.to_numeric(column[epochs], errors="coerce"),
+                unit="s",
+                errors="coerce",
+                utc=True,
+            ).dt.strftime("%Y-%m-%d")
+        retry = dates.isna() & column.notna() & ~epochs
+        if retry.any():
+            dates[retry] = pd.to_datetime(
+                column[retry], errors="coerce", format="mixed"
+            ).dt.strftime("%Y-%m-%d")
+    invalid = dates.isna()
+    if invalid.any():
+        raise DataShapeError(f"Unable to parse date value: {column[invalid].iloc[0]}")
+    return dates
 
 
 def parse_weekly_volumes(payload: Any) -> pd.DataFrame:
     items = _extract_list(payload, ["weeklyVolumesComparison", "data", "items"])
-    rows = []
-    for item in items:
-        week_start = _parse_date(
-            _get_required_key(
-                item,
-                [
-                    "weekStartDate",
-                    "week_start_date",
-                    "week",
-                    "startDate",
-                    "date",
-                ],
-            )
-        )
-        inbound_full = _get_required_key(
-            item,
-            [
-                "inboundFullContainers",
-                "inbound_full_containers",
-                "inboundFullTeu",
-                "inbound_full_teu",
-                "inboundFullTEU",
-            ],
-        )
-        rows.append({"week_start_date": week_start, "inbound_full_containers": inbound_full})
-    df = pd.DataFrame(rows)
-    if df.empty:
+    raw = pd.DataFrame.from_records(items)
+    if raw.empty:
         raise DataShapeError("Weekly volume payload returned no rows.")
-    df["inbound_full_containers"] = pd.to_numeric(
-        df["inbound_full_containers"], errors="coerce"
+    week_start = _get_required_column(
+        raw,
+        ["weekStartDate", "week_start_date", "week", "startDate", "date"],
+    )
+    inbound_full = _get_required_column(
+        raw,
+        [
+            "inboundFullContainers",
+            "inbound_full_containers",
+            "inboundFullTeu",
+            "inbound_full_teu",
+            "inboundFullTEU",
+        ],
+    )
+    return pd.DataFrame(
+        {
+            "week_start_date": _parse_date_column(week_start),
+            "inbound_full_containers": _numeric_column(
+                inbound_full, "Weekly volume payload contained non-numeric inbound values."
+            ),
+        }
     )
-    if df["inbound_full_containers"].isna().any():
-        raise DataShapeError("Weekly volume payload contained non-numeric inbound values.")
-    return df
 
 
 def parse_terminal_containers(payload: Any) -> pd.DataFrame:
     items = _extract_list(payload, ["ContainersAtTerminalData", "data", "items"])
-    rows = []
-    for item in items:
-        load_type = _get_required_key(item, ["loadType", "load_type", "status"]).strip()
-        bucket = _get_required_key(item, ["bucket", "agingBucket", "ageBucket", "aging_bucket"]).strip()
-        containers = _get_required_key(item, ["containers", "containerCount", "value", "count"])
-        rows.append(
-            {
-                "load_type": load_type,
-                "bucket": bucket,
-                "containers": containers,
-            }
-        )
-    df = pd.DataFrame(rows)
-    if df.empty:
+    raw = pd.DataFrame.from_records(items)
+    if raw.empty:
         raise DataShapeError("Terminal container payload returned no rows.")
-    df["containers"] = pd.to_numeric(df["containers"], errors="coerce")
-    if df["containers"].isna().any():
-        raise DataShapeError("Terminal container payload contained non-numeric values.")
-    return df
+    return pd.DataFrame(
+        {
+            "load_type": _get_required_column(raw, ["loadType", "load_type", "status"])
+            .str.strip()
+            .str.lower(),
+            "bucket": _get_required_column(
+                raw, ["bucket", "agingBucket", "ageBucket", "aging_bucket"]
+            ).str.strip(),
+            "containers": _numeric_column(
+                _get_required_column(raw, ["containers", "containerCount", "value", "count"]),
+                "Terminal container payload contained non-numeric values.",
+            ),
+        }
+    )
 
 
 def parse_outgate_metrics(payload: Any) -> pd.DataFrame:
     items = _extract_list(payload, ["FetchOutgatedContainerMetricsData", "data", "items"])
-    rows = []
-    for item in items:
-        status = _get_required_key(item, ["status", "containerStatus", "loadType"]).strip()
-        bucket = _get_required_key(item, ["bucket", "agingBucket", "ageBucket", "aging_bucket"]).strip()
-        containers = _get_required_key(item, ["containers", "containerCount", "value", "count"])
-        rows.append(
-            {
-                "status": status,
-                "bucket": bucket,
-                "containers": containers,
-            }
-        )
-    df = pd.DataFrame(rows)
-    if df.empty:
+    raw = pd.DataFrame.from_records(items)
+    if raw.empty:
         raise DataShapeError("Outgate metrics payload returned no rows.")
-    df["containers"] = pd.to_numeric(df["containers"], errors="coerce")
-    if df["containers"].isna().any():
-        raise DataShapeError("Outgate metrics payload contained non-numeric values.")
-    return df
+    return pd.DataFrame(
+        {
+            "status": _get_required_column(raw, ["status", "containerStatus", "loadType"]).str.strip(),
+            "bucket": _get_required_column(
+                raw, ["bucket", "agingBucket", "ageBucket", "aging_bucket"]
+            ).str.strip(),
+            "containers": _numeric_column(
+                _get_required_column(raw, ["containers", "containerCount", "value", "count"]),
+                "Outgate metrics payload contained non-numeric values.",
+            ),
+        }
+    )
 
 
 def parse_berth_data(payload: Any) -> pd.DataFrame:
     items = _extract_list(payload, ["FetchQuickviewDashboardBerthData", "vessels", "data", "items"])
-    rows = []
-    for item in items:
-        vessel = _get_required_key(item, ["vessel", "vesselName", "name"]).strip()
-        hours = _get_required_key(
-            item,
-            ["timeAtBerthHours", "hoursAtBerth", "time_at_berth_hours", "hours"],
-        )
-        terminal = item.get("terminal") or item.get("terminalName")
-        rows.append(
-            {
-                "vessel": vessel,
-                "time_at_berth_hours": hours,
-                "terminal": terminal,
-            }
-        )
-    df = pd.DataFrame(rows)
-    if df.empty:
+    raw = pd.DataFrame.from_records(items)
+    if raw.empty:
         raise DataShapeError("Berth payload returned no rows.")
-    df["time_at_berth_hours"] = pd.to_numeric(df["time_at_berth_hours"], errors="coerce")
-    if df["time_at_berth_hours"].isna().any():
-        raise DataShapeError("Berth payload contained non-numeric time values.")
-    return df
+    return pd.DataFrame(
+        {
+            "vessel": _get_required_column(raw, ["vessel", "vesselName", "name"]).str.strip(),
+            "time_at_berth_hours": _numeric_column(
+                _get_required_column(
+                    raw,
+                    ["timeAtBerthHours", "hoursAtBerth", "time_at_berth_hours", "hours"],
+                ),
+                "Berth payload contained non-numeric time values.",
+            ),
+            "terminal": _get_optional_column(raw, ["terminal", "terminalName"]),
+        }
+    )